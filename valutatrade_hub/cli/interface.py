@@ -7,16 +7,16 @@ It is called from main.py for Poetry script `project`.
 from __future__ import annotations
 
 import argparse
+import io
+import json
 import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
 from decimal import Decimal
 
-from prettytable import PrettyTable
-
 from valutatrade_hub.core.exceptions import DomainError
-from valutatrade_hub.core.usecases import PortfolioUsecase, RatesUsecase, UsersUsecase
 from valutatrade_hub.core.utils import normalize_currency_code, parse_positive_decimal
 from valutatrade_hub.logging_config import setup_logging
-from valutatrade_hub.parser_service.updater import RatesUpdater
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -48,16 +48,23 @@ def _build_parser() -> argparse.ArgumentParser:
 
     sub.add_parser("update-rates", help="Fetch and update rates cache")
     sub.add_parser("show-rates", help="Show all cached rates")
+    sub.add_parser("batch", help="Run NDJSON commands from stdin in one process")
 
     return parser
 
 
-def main(argv: list[str] | None = None) -> None:
-    """CLI main."""
-    setup_logging()
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Run one parsed command and return exit code.
 
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+    Domain code, prettytable and the Parser Service (requests) are imported
+    here and in the branches that need them, so `--help` and argument errors
+    exit before loading them.
+    """
+    from valutatrade_hub.core.usecases import (
+        PortfolioUsecase,
+        RatesUsecase,
+        UsersUsecase,
+    )
 
     users = UsersUsecase()
     portfolio_uc = PortfolioUsecase()
@@ -92,13 +99,19 @@ def main(argv: list[str] | None = None) -> None:
                 )
 
             case "show-portfolio":
+                from prettytable import PrettyTable
+
                 base = normalize_currency_code(args.base)
                 portfolio, values, total = portfolio_uc.show_portfolio(base=base)
 
                 t = PrettyTable()
                 t.field_names = ["Currency", "Balance", f"Value in {base}"]
-                for code, wallet in portfolio.wallets.items():
-                    t.add_row([code, float(wallet.balance), round(values.get(code, 0.0), 6)])
+                t.add_rows(
+                    [
+                        [code, float(wallet.balance), round(values.get(code, 0.0), 6)]
+                        for code, wallet in portfolio.wallets.items()
+                    ]
+                )
                 t.add_row(["TOTAL", "", round(total, 6)])
                 print(t)
 
@@ -109,28 +122,105 @@ def main(argv: list[str] | None = None) -> None:
                 print(f"{frm}->{to} = {rate} (updated_at={updated_at})")
 
             case "update-rates":
+                from valutatrade_hub.parser_service.updater import RatesUpdater
+
                 RatesUpdater().update()
                 print("OK: rates updated")
 
             case "show-rates":
+                from prettytable import PrettyTable
+
+                from valutatrade_hub.parser_service.updater import RatesUpdater
+
                 data = RatesUpdater().read_cache()
                 t = PrettyTable()
                 t.field_names = ["Pair", "Rate", "Updated at"]
-                for key, rec in sorted(data.items()):
-                    if key in {"source", "last_refresh"}:
-                        continue
-                    t.add_row([key, rec.get("rate"), rec.get("updated_at")])
+                t.add_rows(
+                    [
+                        [key, rec.get("rate"), rec.get("updated_at")]
+                        for key, rec in sorted(data.items())
+                        if key not in {"source", "last_refresh"}
+                    ]
+                )
                 print(t)
                 if "last_refresh" in data:
                     print(f"last_refresh={data['last_refresh']} source={data.get('source')}")
 
             case _:
                 parser.print_help()
-                sys.exit(2)
+                return 2
 
     except DomainError as e:
         print(f"ERROR: {e}")
-        sys.exit(1)
+        return 1
     except ValueError as e:
         print(f"ERROR: {e}")
-        sys.exit(1)
+        return 1
+
+    return 0
+
+
+def _run_batch_line(parser: argparse.ArgumentParser, line: str) -> int:
+    """Run one batch input line and return its exit code."""
+    try:
+        argv = json.loads(line)["argv"]
+        if not isinstance(argv, list):
+            raise TypeError(f"argv должен быть списком, получено {type(argv).__name__}")
+        argv = [str(a) for a in argv]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"ERROR: ожидается строка вида {{\"argv\": [...]}}: {e}")
+        return 2
+
+    try:
+        args = parser.parse_args(argv)
+        if args.command == "batch":
+            print("ERROR: batch нельзя вызывать внутри batch")
+            return 2
+        return _run(parser, args)
+    except SystemExit as e:
+        # argparse exits on --help and on invalid arguments
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        # Keep the worker alive: report the failure as this line's result.
+        traceback.print_exc()
+        return 1
+
+
+def _run_batch(parser: argparse.ArgumentParser) -> int:
+    """Run commands from stdin, paying interpreter startup only once.
+
+    Each input line: {"argv": ["buy", "--currency", "BTC", "--amount", "1"]}
+    Each output line: {"rc": 0, "stdout": "...", "stderr": "..."}
+    """
+    for line in iter(sys.stdin.readline, ""):
+        if not line.strip():
+            continue
+
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            rc = _run_batch_line(parser, line)
+
+        result = {"rc": rc, "stdout": out.getvalue(), "stderr": err.getvalue()}
+        sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    return 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI main."""
+    setup_logging()
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "batch":
+        rc = _run_batch(parser)
+    else:
+        rc = _run(parser, args)
+
+    if rc:
+        sys.exit(rc)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
 
 from valutatrade_hub.core.exceptions import CurrencyNotFoundError
@@ -16,6 +17,8 @@ class Currency(ABC):
         code: Code/ticker (e.g. "USD", "BTC").
     """
 
+    __slots__ = ("name", "code")
+
     def __init__(self, name: str, code: str) -> None:
         if not name or not isinstance(name, str):
             raise ValueError("name должен быть непустой строкой")
@@ -30,6 +33,8 @@ class Currency(ABC):
 class FiatCurrency(Currency):
     """Fiat currency."""
 
+    __slots__ = ("issuing_country",)
+
     def __init__(self, name: str, code: str, issuing_country: str) -> None:
         super().__init__(name=name, code=code)
         if not issuing_country or not isinstance(issuing_country, str):
@@ -43,6 +48,8 @@ class FiatCurrency(Currency):
 class CryptoCurrency(Currency):
     """Crypto currency."""
 
+    __slots__ = ("algorithm", "market_cap")
+
     def __init__(self, name: str, code: str, algorithm: str, market_cap: float) -> None:
         super().__init__(name=name, code=code)
         if not algorithm or not isinstance(algorithm, str):
@@ -66,9 +73,13 @@ _CURRENCIES: dict[str, Currency] = {
 }
 
 
+@functools.cache
 def get_currency(code: str) -> Currency:
     """Get Currency object by code.
 
+    Registry is fixed at import time, so lookups are memoized
+    (unknown codes raise and are not cached).
+
     Args:
         code: Currency code (any case, trimmed).
 
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
 import secrets
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any
 
 from valutatrade_hub.core.exceptions import InsufficientFundsError
 from valutatrade_hub.core.utils import normalize_currency_code, parse_positive_decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserDump:
     """Serializable representation of a User (for users.json)."""
 
@@ -27,6 +30,14 @@ class UserDump:
 class User:
     """User entity with private fields and salted SHA-256 password hash."""
 
+    __slots__ = (
+        "_user_id",
+        "_username",
+        "_hashed_password",
+        "_salt",
+        "_registration_date",
+    )
+
     def __init__(
         self,
         user_id: int,
@@ -89,8 +100,11 @@ class User:
         }
 
     def verify_password(self, password: str) -> bool:
-        """Verify password against stored hash."""
-        return self._hash_password(password=password, salt=self._salt) == self._hashed_password
+        """Verify password against stored hash (constant-time compare)."""
+        return hmac.compare_digest(
+            self._hash_password(password=password, salt=self._salt).encode(),
+            self._hashed_password.encode(),
+        )
 
     def change_password(self, new_password: str) -> None:
         """Change password and update hash."""
@@ -112,6 +126,8 @@ class User:
 class Wallet:
     """Wallet for a single currency."""
 
+    __slots__ = ("currency_code", "_balance")
+
     def __init__(self, currency_code: str, balance: Decimal = Decimal("0")) -> None:
         self.currency_code = normalize_currency_code(currency_code)
         self.balance = balance
@@ -154,9 +170,12 @@ class Wallet:
 class Portfolio:
     """Portfolio with wallets of a single user."""
 
+    __slots__ = ("_user_id", "_wallets", "_wallets_view")
+
     def __init__(self, user_id: int, wallets: dict[str, Wallet] | None = None) -> None:
         self._user_id = int(user_id)
         self._wallets: dict[str, Wallet] = wallets or {}
+        self._wallets_view = MappingProxyType(self._wallets)
 
     @property
     def user_id(self) -> int:
@@ -164,16 +183,17 @@ class Portfolio:
         return self._user_id
 
     @property
-    def wallets(self) -> dict[str, Wallet]:
-        """Copy of wallets mapping."""
-        return self._wallets.copy()
+    def wallets(self) -> Mapping[str, Wallet]:
+        """Read-only view of wallets mapping (no copy per access)."""
+        return self._wallets_view
 
     def add_currency(self, currency_code: str) -> Wallet:
         """Add wallet for currency if missing and return it."""
         code = normalize_currency_code(currency_code)
-        if code not in self._wallets:
-            self._wallets[code] = Wallet(code)
-        return self._wallets[code]
+        wallet = self._wallets.get(code)
+        if wallet is None:
+            wallet = self._wallets[code] = Wallet(code)
+        return wallet
 
     def get_wallet(self, currency_code: str) -> Wallet:
         """Get wallet for currency (auto-create if missing)."""
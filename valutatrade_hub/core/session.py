@@ -5,10 +5,14 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from valutatrade_hub.infra.settings import settings
+
 
 class SessionUser:
     """Current user in session."""
 
+    __slots__ = ("user_id", "username")
+
     def __init__(self, user_id: int, username: str) -> None:
         self.user_id = user_id
         self.username = username
@@ -19,38 +23,42 @@ class SessionManager:
 
     def __init__(self) -> None:
         self._current_user: SessionUser | None = None
-        self._session_file = Path("data/.session.json")
-        self._load_session()
+        self._session_loaded = False
+        self._session_file = Path(str(settings.get("datadir", "data"))) / ".session.json"
 
     @property
     def is_authenticated(self) -> bool:
         """Return True if user is logged in."""
-        if self._current_user is None:
+        if not self._session_loaded:
             self._load_session()
         return self._current_user is not None
 
     @property
     def current_user(self) -> SessionUser | None:
         """Return current logged-in user (or None)."""
-        if self._current_user is None:
+        if not self._session_loaded:
             self._load_session()
         return self._current_user
 
     def login(self, user_id: int, username: str) -> None:
         """Set current user and save to file."""
         self._current_user = SessionUser(user_id=user_id, username=username)
+        self._session_loaded = True
         self._save_session()
 
     def logout(self) -> None:
         """Clear session and remove file."""
         self._current_user = None
-        if self._session_file.exists():
-            self._session_file.unlink()
+        self._session_loaded = True
+        self._session_file.unlink(missing_ok=True)
 
     def _load_session(self) -> None:
-        """Load session from file if exists."""
-        if not self._session_file.exists():
-            return
+        """Load session from file if exists.
+
+        Called lazily on first access to is_authenticated/current_user;
+        after that login/logout keep the in-memory state in sync.
+        """
+        self._session_loaded = True
         try:
             with open(self._session_file, encoding="utf-8") as f:
                 data = json.load(f)
@@ -58,16 +66,22 @@ class SessionManager:
                 user_id=int(data["user_id"]),
                 username=str(data["username"]),
             )
+        except FileNotFoundError:
+            return
         except Exception:
             self._current_user = None
 
     def _save_session(self) -> None:
-        """Save session to file."""
+        """Save session to file atomically (write *.tmp, then rename).
+
+        Session is cache state (losing it only means re-login), so no fsync.
+        """
         if self._current_user is None:
             return
         self._session_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._session_file.with_name(self._session_file.name + ".tmp")
         try:
-            with open(self._session_file, "w", encoding="utf-8") as f:
+            with open(tmp, "w", encoding="utf-8") as f:
                 json.dump(
                     {
                         "user_id": self._current_user.user_id,
@@ -76,6 +90,7 @@ class SessionManager:
                     f,
                     ensure_ascii=False,
                 )
+            tmp.replace(self._session_file)
         except Exception:
             pass
 
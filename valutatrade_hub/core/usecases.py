@@ -8,13 +8,19 @@ Rules:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
 from valutatrade_hub.core.currencies import get_currency
-from valutatrade_hub.core.exceptions import ApiRequestError, AuthenticationError
+from valutatrade_hub.core.exceptions import (
+    ApiRequestError,
+    AuthenticationError,
+    DatabaseError,
+)
 from valutatrade_hub.core.models import Portfolio, User, Wallet
 from valutatrade_hub.core.session import session_manager
 from valutatrade_hub.core.utils import normalize_currency_code, parse_positive_decimal
@@ -71,8 +77,11 @@ class UsersUsecase:
 class PortfolioUsecase:
     """Trading and portfolio operations."""
 
-    def _load_portfolio(self, user_id: int) -> Portfolio:
-        portfolios = db.read_list("portfolios")
+    def _load_portfolio(
+        self, user_id: int, portfolios: list[dict[str, Any]] | None = None
+    ) -> Portfolio:
+        if portfolios is None:
+            portfolios = db.read_list("portfolios")
         raw = next((p for p in portfolios if p.get("user_id") == user_id), None)
         if raw is None:
             return Portfolio(user_id=user_id, wallets={})
@@ -80,13 +89,22 @@ class PortfolioUsecase:
         wallets: dict[str, Wallet] = {}
         raw_wallets = raw.get("wallets") or {}
         for code, w in raw_wallets.items():
-            wallets[code] = Wallet(
+            wallet = Wallet(
                 currency_code=code, balance=Decimal(str(w.get("balance", 0)))
             )
+            if wallet.currency_code in wallets:
+                raise DatabaseError(
+                    f"portfolios.json: у пользователя {user_id} несколько "
+                    f"кошельков {wallet.currency_code}"
+                )
+            wallets[wallet.currency_code] = wallet
         return Portfolio(user_id=user_id, wallets=wallets)
 
-    def _save_portfolio(self, portfolio: Portfolio) -> None:
-        portfolios = db.read_list("portfolios")
+    def _save_portfolio(
+        self, portfolio: Portfolio, portfolios: list[dict[str, Any]] | None = None
+    ) -> None:
+        if portfolios is None:
+            portfolios = db.read_list("portfolios")
         for i, p in enumerate(portfolios):
             if p.get("user_id") == portfolio.user_id:
                 portfolios[i] = portfolio.to_json_payload()
@@ -95,6 +113,18 @@ class PortfolioUsecase:
         portfolios.append(portfolio.to_json_payload())
         db.write_list("portfolios", portfolios)
 
+    @contextmanager
+    def batch(self, user_id: int) -> Iterator[Portfolio]:
+        """Load portfolio once, apply several mutations, save once on exit.
+
+        portfolios.json is read once and the same list is written back on
+        exit. Nothing is written if the block raises.
+        """
+        portfolios = db.read_list("portfolios")
+        portfolio = self._load_portfolio(user_id, portfolios)
+        yield portfolio
+        self._save_portfolio(portfolio, portfolios)
+
     @require_auth
     @log_action("BUY", verbose=True)
     def buy(
@@ -104,8 +134,8 @@ class PortfolioUsecase:
         code = normalize_currency_code(currency_code)
         base_code = normalize_currency_code(base)
 
-        get_currency(code)
-        get_currency(base_code)
+        # get_rate validates both codes, so no separate get_currency calls
+        rate, updated_at = RatesUsecase().get_rate(code, base_code)
 
         amt = parse_positive_decimal(amount)
 
@@ -113,17 +143,14 @@ class PortfolioUsecase:
         if user is None:
             raise AuthenticationError("Сначала выполните login")
 
-        portfolio = self._load_portfolio(user.user_id)
-        wallet = portfolio.get_wallet(code)
+        with self.batch(user.user_id) as portfolio:
+            wallet = portfolio.get_wallet(code)
 
-        old_balance = wallet.balance
-        wallet.deposit(amt)
+            old_balance = wallet.balance
+            wallet.deposit(amt)
 
-        rate, updated_at = RatesUsecase().get_rate(code, base_code)
         estimated_cost = float(amt) * rate
 
-        self._save_portfolio(portfolio)
-
         return {
             "currency": code,
             "amount": float(amt),
@@ -144,8 +171,8 @@ class PortfolioUsecase:
         code = normalize_currency_code(currency_code)
         base_code = normalize_currency_code(base)
 
-        get_currency(code)
-        get_currency(base_code)
+        # get_rate validates both codes, so no separate get_currency calls
+        rate, updated_at = RatesUsecase().get_rate(code, base_code)
 
         amt = parse_positive_decimal(amount)
 
@@ -153,17 +180,14 @@ class PortfolioUsecase:
         if user is None:
             raise AuthenticationError("Сначала выполните login")
 
-        portfolio = self._load_portfolio(user.user_id)
-        wallet = portfolio.get_wallet(code)
+        with self.batch(user.user_id) as portfolio:
+            wallet = portfolio.get_wallet(code)
 
-        old_balance = wallet.balance
-        wallet.withdraw(amt)
+            old_balance = wallet.balance
+            wallet.withdraw(amt)
 
-        rate, updated_at = RatesUsecase().get_rate(code, base_code)
         estimated_proceeds = float(amt) * rate
 
-        self._save_portfolio(portfolio)
-
         return {
             "currency": code,
             "amount": float(amt),
@@ -187,7 +211,8 @@ class PortfolioUsecase:
 
         portfolio = self._load_portfolio(user.user_id)
 
-        rates = RatesUsecase()
+        codes = [code for code in portfolio.wallets if code != base_code]
+        rates = RatesUsecase().get_rates(codes, base_code) if codes else {}
         values: dict[str, float] = {}
         total = 0.0
 
@@ -195,8 +220,7 @@ class PortfolioUsecase:
             if code == base_code:
                 value = float(wallet.balance)
             else:
-                rate, _ = rates.get_rate(code, base_code)
-                value = float(wallet.balance) * rate
+                value = float(wallet.balance) * rates[code]
             values[code] = value
             total += value
 
@@ -214,14 +238,8 @@ class RatesUsecase:
         last = datetime.fromisoformat(last_refresh_iso)
         return (datetime.now() - last) <= timedelta(seconds=ttl)
 
-    def get_rate(self, from_code: str, to_code: str) -> tuple[float, str]:
-        """Get rate from cache rates.json; fails if missing/expired."""
-        frm = normalize_currency_code(from_code)
-        to = normalize_currency_code(to_code)
-
-        get_currency(frm)
-        get_currency(to)
-
+    def _read_fresh(self) -> dict[str, Any]:
+        """Read rates.json; fails if cache is empty or expired."""
         data = db.read_obj("rates", default={})
 
         last_refresh = data.get("last_refresh")
@@ -231,9 +249,41 @@ class RatesUsecase:
         if not self._is_fresh(str(last_refresh)):
             raise ApiRequestError("Кеш курсов устарел. Выполните update-rates")
 
-        pair = self._pair_key(frm, to)
-        rec = data.get(pair)
+        return data
+
+    def _lookup(self, data: dict[str, Any], frm: str, to: str) -> dict[str, Any]:
+        rec = data.get(self._pair_key(frm, to))
         if rec is None:
             raise ApiRequestError(f"Курс {frm}→{to} недоступен. Выполните update-rates")
+        return rec
+
+    def get_rate(self, from_code: str, to_code: str) -> tuple[float, str]:
+        """Get rate from cache rates.json; fails if missing/expired."""
+        frm = normalize_currency_code(from_code)
+        to = normalize_currency_code(to_code)
+
+        get_currency(frm)
+        get_currency(to)
 
+        rec = self._lookup(self._read_fresh(), frm, to)
         return float(rec["rate"]), str(rec["updated_at"])
+
+    def get_rates(self, from_codes: list[str], to_code: str) -> dict[str, float]:
+        """Get rates from_code->to_code for several codes with one cache read.
+
+        Keys of the result are the codes as passed in.
+        """
+        to = normalize_currency_code(to_code)
+        get_currency(to)
+
+        pairs: dict[str, str] = {}
+        for code in from_codes:
+            frm = normalize_currency_code(code)
+            get_currency(frm)
+            pairs[code] = frm
+
+        data = self._read_fresh()
+        return {
+            code: float(self._lookup(data, frm, to)["rate"])
+            for code, frm in pairs.items()
+        }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from decimal import Decimal, InvalidOperation
 
 
@@ -14,6 +15,10 @@ def normalize_currency_code(code: str) -> str:
     - Length 2..5
     - No spaces
 
+    The result is interned, so equal codes share one object. Dict lookups
+    check identity before equality; with a handful of wallets and currencies
+    this is tidiness rather than a measurable speedup.
+
     Args:
         code: Raw currency code from user input.
 
@@ -29,7 +34,7 @@ def normalize_currency_code(code: str) -> str:
     norm = code.strip().upper()
     if " " in norm or not (2 <= len(norm) <= 5):
         raise ValueError("currency_code должен быть 2–5 символов, без пробелов, UPPER")
-    return norm
+    return sys.intern(norm)
 
 
 def parse_positive_decimal(value: str | int | float | Decimal) -> Decimal:
@@ -31,7 +31,7 @@ def log_action(
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            from valuatatrade_hub.core.session import session_manager
+            from valutatrade_hub.core.session import session_manager
 
             started = time.time()
             user = session_manager.current_user
@@ -87,8 +87,8 @@ def require_auth(func: F) -> F:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        from valuatatrade_hub.core.exceptions import AuthenticationError
-        from valuatatrade_hub.core.session import session_manager
+        from valutatrade_hub.core.exceptions import AuthenticationError
+        from valutatrade_hub.core.session import session_manager
 
         if not session_manager.is_authenticated:
             raise AuthenticationError("Сначала выполните login")
@@ -39,14 +39,14 @@ class DatabaseManager:
     def read_list(self, name: str) -> list[dict[str, Any]]:
         """Read JSON list from file, return [] if file does not exist."""
         path = self._path(name)
-        if not os.path.exists(path):
-            return []
         try:
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
             if not isinstance(data, list):
                 raise DatabaseError(f"{name}.json должен содержать список")
             return data
+        except FileNotFoundError:
+            return []
         except Exception as e:
             raise DatabaseError(f"Ошибка чтения {path}: {e}") from e
 
@@ -66,14 +66,14 @@ class DatabaseManager:
     def read_obj(self, name: str, default: dict[str, Any] | None = None) -> dict[str, Any]:
         """Read JSON object from file, return default/{} if file missing."""
         path = self._path(name)
-        if not os.path.exists(path):
-            return default or {}
         try:
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
             if not isinstance(data, dict):
                 raise DatabaseError(f"{name}.json должен содержать объект")
             return data
+        except FileNotFoundError:
+            return default or {}
         except Exception as e:
             raise DatabaseError(f"Ошибка чтения {path}: {e}") from e
 
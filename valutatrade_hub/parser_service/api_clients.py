@@ -9,8 +9,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 import requests
-from valuatatrade_hub.core.exceptions import ApiRequestError
-from valuatatrade_hub.parser_service.config import parser_config
+
+from valutatrade_hub.core.exceptions import ApiRequestError
+from valutatrade_hub.parser_service.config import parser_config
 
 
 @dataclass(frozen=True)